@@ -1,4 +1,5 @@
 import math
+from functools import cached_property
 
 
 class InFlow:
@@ -21,13 +22,34 @@ class InFlow:
         if pwf > pres is True:
             raise ValueError("Flowing pressure is greater than reservoir pressure")
 
-        self.qwf = qwf
-        self.pwf = pwf
-        self.pres = pres
+        self._qwf = qwf
+        self._pwf = pwf
+        self._pres = pres
 
     def __repr__(self) -> str:
         return f"Tested inflow of {self.qwf} bopd at {self.pwf} psig"
 
+    # the test is read only, so the ipr constants calculated from it never go stale
+    @property
+    def qwf(self) -> float:
+        return self._qwf
+
+    @property
+    def pwf(self) -> float:
+        return self._pwf
+
+    @property
+    def pres(self) -> float:
+        return self._pres
+
+    @cached_property
+    def pidx(self) -> float:
+        return self.prod_index(self.qwf, self.pwf, self.pres)
+
+    @cached_property
+    def qmax(self) -> float:
+        return self.vogel_qmax(self.qwf, self.pwf, self.pres)
+
     @staticmethod
     def prod_index(qwf: float, pwf: float, pres: float) -> float:
         """Productivity Index of the Wellbore
@@ -84,11 +106,10 @@ class InFlow:
             ValueError("Flowing pressure must be less than reservoir pressure")
 
         if method == "vogel":
-            qmax = self.vogel_qmax(self.qwf, self.pwf, self.pres)
-            qnew = qmax * (1 - 0.2 * (pnew / self.pres) - 0.8 * (pnew / self.pres) ** 2)
+            pfrac = pnew / self.pres
+            qnew = self.qmax * (1 - 0.2 * pfrac - 0.8 * pfrac * pfrac)
 
         else:
-            pidx = self.prod_index(self.qwf, self.pwf, self.pres)
-            qnew = pidx * (self.pres - pnew)
+            qnew = self.pidx * (self.pres - pnew)
 
         return qnew
@@ -1,4 +1,7 @@
+from typing import TYPE_CHECKING
+
 import numpy as np
+from scipy import optimize
 
 from flow import jetflow as jf
 from flow import jetplot as jplt
@@ -8,7 +11,10 @@ from flow.inflow import InFlow
 from geometry.jetpump import JetPump
 from geometry.pipe import Annulus, Pipe
 from geometry.wellprofile import WellProfile
-from pvt.resmix import ResMix
+from pvt.resmix import ResMix, ResMixTable
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 # writing a function that can be ran to easily compare current jet pump
@@ -22,7 +28,8 @@ def jet_check(
     tube: Pipe,
     ipr_well: InFlow,
     prop_well: ResMix,
-) -> None:
+    show: bool = True,
+) -> tuple["Figure", "Figure"]:
     psu_min, qoil_std, te_book = jf.psu_minimize(
         tsu=form_temp, ken=jpump_well.ken, ate=jpump_well.ate, ipr_su=ipr_well, prop_su=prop_well
     )
@@ -34,28 +41,33 @@ def jet_check(
     qnz_ft3s, qnz_bpd = jf.nozzle_rate(vnz, jpump_well.anz)
     wc_tm, qwat_su = jf.throat_wc(qoil_std, prop_well.wc, qnz_bpd)
 
-    prop_tm = ResMix(wc_tm, prop_well.fgor, prop_well.oil, prop_well.wat, prop_well.gas)
+    prop_tm = prop_well.with_wc(wc_tm)
     ptm = jf.throat_discharge(
         pte, form_temp, jpump_well.kth, vnz, jpump_well.anz, rho_pf, vte, jpump_well.ate, rho_te, prop_tm
     )
     vtm, pdi = jf.diffuser_discharge(ptm, form_temp, jpump_well.kdi, jpump_well.ath, tube.inn_area, qoil_std, prop_tm)
 
-    print(f"Suction Pressure: {round(psu_min, 1)} psig")
-    print(f"Oil Flow: {round(qoil_std, 1)} bopd")
-    print(f"Nozzle Inlet Pressure: {round(pni, 1)} psig")
-    print(f"Throat Entry Pressure: {round(pte, 1)} psig")
-    print(f"Throat Discharge Pressure: {round(ptm, 1)} psig")
-    print(f"Diffuser Discharge Pressure: {round(pdi, 1)} psig")
-    print(f"Power Fluid Rate: {round(qnz_bpd, 1)} bwpd")
-    print(f"Nozzle Velocity: {round(vnz, 1)} ft/s")
-    print(f"Throat Entry Velocity: {round(vte, 1)} ft/s")
+    # collect the results and write them out at once
+    results = [
+        f"Suction Pressure: {round(psu_min, 1)} psig",
+        f"Oil Flow: {round(qoil_std, 1)} bopd",
+        f"Nozzle Inlet Pressure: {round(pni, 1)} psig",
+        f"Throat Entry Pressure: {round(pte, 1)} psig",
+        f"Throat Discharge Pressure: {round(ptm, 1)} psig",
+        f"Diffuser Discharge Pressure: {round(pdi, 1)} psig",
+        f"Power Fluid Rate: {round(qnz_bpd, 1)} bwpd",
+        f"Nozzle Velocity: {round(vnz, 1)} ft/s",
+        f"Throat Entry Velocity: {round(vte, 1)} ft/s",
+    ]
+    print("\n".join(results))
 
     # graphing some outputs for visualization
     qoil_std, te_book = jplt.throat_entry_book(psu_min, form_temp, jpump_well.ken, jpump_well.ate, ipr_well, prop_well)
-    te_book.plot_te()
+    fig_te = te_book.plot_te(show)
 
     vtm, di_book = jplt.diffuser_book(ptm, form_temp, jpump_well.ath, jpump_well.kdi, tube.inn_area, qoil_std, prop_tm)
-    di_book.plot_di()
+    fig_di = di_book.plot_di(show)
+    return fig_te, fig_di
 
 
 # writing a function that can be ran to easily compare current jet pump
@@ -70,11 +82,13 @@ def jet_check_two(
     wellprof: WellProfile,
     ipr_well: InFlow,
     prop_well: ResMix,
-) -> None:
+    show: bool = True,
+) -> tuple["Figure", "Figure"]:
     """Jet Check Two
 
     Brings in the outflow node of the jet pump system, looking at the required discharge pressure
-    at the wells flowrate vs what the pump can actually supply.
+    at the wells flowrate vs what the pump can actually supply. The throat entry and diffuser
+    figures are returned, pass show as False for batch runs and close them when done.
     """
     psu_min, qoil_std, te_book = jf.psu_minimize(
         tsu=form_temp, ken=jpump_well.ken, ate=jpump_well.ate, ipr_su=ipr_well, prop_su=prop_well
@@ -86,7 +100,7 @@ def jet_check_two(
     qnz_ft3s, qnz_bpd = jf.nozzle_rate(vnz, jpump_well.anz)
     wc_tm, qwat_su = jf.throat_wc(qoil_std, prop_well.wc, qnz_bpd)
 
-    prop_tm = ResMix(wc_tm, prop_well.fgor, prop_well.oil, prop_well.wat, prop_well.gas)
+    prop_tm = prop_well.with_wc(wc_tm)
     ptm = jf.throat_discharge(
         pte, form_temp, jpump_well.kth, vnz, jpump_well.anz, rho_pf, vte, jpump_well.ate, rho_te, prop_tm
     )
@@ -102,28 +116,32 @@ def jet_check_two(
     else:
         pdi_str = f"Well will NOT flow, discharge pressure is {round(diff_pdi, 0)} psig below the required"
 
-    print(f"Suction Pressure: {round(psu_min, 1)} psig")
-    print(f"Oil Flow: {round(qoil_std, 1)} bopd")
-    print(f"Nozzle Inlet Pressure: {round(pni, 1)} psig")
-    print(f"Throat Entry Pressure: {round(pte, 1)} psig")
-    print(f"Throat Discharge Pressure: {round(ptm, 1)} psig")
-    print(f"Required Diffuser Discharge Pressure: {round(prs_ray[-1], 1)} psig")
-    print(f"Supplied Diffuser Discharge Pressure: {round(pdi, 1)} psig")
-    print(pdi_str)
-    print(f"Power Fluid Rate: {round(qnz_bpd, 1)} bwpd")
-    print(f"Nozzle Velocity: {round(vnz, 1)} ft/s")
-    print(f"Throat Entry Velocity: {round(vte, 1)} ft/s")
+    # collect the results and write them out at once
+    results = [
+        f"Suction Pressure: {round(psu_min, 1)} psig",
+        f"Oil Flow: {round(qoil_std, 1)} bopd",
+        f"Nozzle Inlet Pressure: {round(pni, 1)} psig",
+        f"Throat Entry Pressure: {round(pte, 1)} psig",
+        f"Throat Discharge Pressure: {round(ptm, 1)} psig",
+        f"Required Diffuser Discharge Pressure: {round(prs_ray[-1], 1)} psig",
+        f"Supplied Diffuser Discharge Pressure: {round(pdi, 1)} psig",
+        pdi_str,
+        f"Power Fluid Rate: {round(qnz_bpd, 1)} bwpd",
+        f"Nozzle Velocity: {round(vnz, 1)} ft/s",
+        f"Throat Entry Velocity: {round(vte, 1)} ft/s",
+    ]
+    print("\n".join(results))
 
     # add the outflow, with the liquid holdup and pressure
 
     # graphing some outputs for visualization
     qsu_std, te_book = jplt.throat_entry_book(psu_min, form_temp, jpump_well.ken, jpump_well.ate, ipr_well, prop_well)
-    te_book.plot_te()
+    fig_te = te_book.plot_te(show)
     # print(te_book)
     vtm, di_book = jplt.diffuser_book(ptm, form_temp, jpump_well.ath, jpump_well.kdi, tube.inn_area, qsu_std, prop_tm)
-    di_book.plot_di()
+    fig_di = di_book.plot_di(show)
     # print(di_book)
-    # te_book.plot()
+    return fig_te, fig_di
 
 
 def jetpump_solver(
@@ -162,10 +180,17 @@ def jetpump_solver(
         qnz_bwpd (float): Power Fluid Rate, BWPD
         mach_te (float): Throat Entry Mach, unitless
     """
-    psu_min, qoil_std, te_book = jf.psu_minimize(tsu=tsu, ken=jpump.ken, ate=jpump.ate, ipr_su=ipr_su, prop_su=prop_su)
-    res_min, qoil_std, fwat_bwpd, qnz_bwpd, mach_te = discharge_residual(
-        psu_min, pwh, tsu, rho_pf, ppf_surf, jpump, wellbore, wellprof, ipr_su, prop_su
+    prop_tab = jf.suction_table(tsu, ipr_su, prop_su)  # shared by every throat entry march
+    pni = ppf_surf + sp.diff_press_static(rho_pf, wellprof.jetpump_vd)  # static, same for every psu
+    psu_min, qoil_std, te_book = jf.psu_minimize(
+        tsu=tsu, ken=jpump.ken, ate=jpump.ate, ipr_su=ipr_su, prop_su=prop_su, prop_tab=prop_tab
     )
+    # every residual is an outflow march, keep them so no psu is evaluated twice
+    res_dict = {}
+    res_dict[psu_min] = discharge_residual(
+        psu_min, pwh, tsu, rho_pf, ppf_surf, jpump, wellbore, wellprof, ipr_su, prop_su, prop_tab, pni
+    )
+    res_min, qoil_std, fwat_bwpd, qnz_bwpd, mach_te = res_dict[psu_min]
 
     # if the jetpump (available) discharge is above the outflow (required) discharge at lowest suction
     # the well will flow, but at its critical limit
@@ -174,7 +199,10 @@ def jetpump_solver(
         return psu_min, sonic_status, qoil_std, fwat_bwpd, qnz_bwpd, mach_te
 
     psu_max = ipr_su.pres - 10  # max suction pressure that can be used
-    res_max, *etc = discharge_residual(psu_max, pwh, tsu, rho_pf, ppf_surf, jpump, wellbore, wellprof, ipr_su, prop_su)
+    res_dict[psu_max] = discharge_residual(
+        psu_max, pwh, tsu, rho_pf, ppf_surf, jpump, wellbore, wellprof, ipr_su, prop_su, prop_tab, pni
+    )
+    res_max = res_dict[psu_max][0]
 
     # if the jetpump (available) discharge is below the outflow (required) discharge at highest suction
     # the well will not flow, need to pick different parameters
@@ -182,24 +210,22 @@ def jetpump_solver(
         sonic_status = False  # add code that if the flow is no, return np.NaN
         return np.nan, sonic_status, np.nan, np.nan, np.nan, np.nan
 
-    # start secant hunting for the answer, in between the two points
-    psu_list = [psu_min, psu_max]
-    res_list = [res_min, res_max]
+    # the residual changes sign between the two points, use brent's method inside the bracket
+    def res_psu(psu: float) -> float:
+        if psu not in res_dict:
+            res_dict[psu] = discharge_residual(
+                psu, pwh, tsu, rho_pf, ppf_surf, jpump, wellbore, wellprof, ipr_su, prop_su, prop_tab, pni
+            )
+        return res_dict[psu][0]
 
     psu_diff = 5  # criteria for when you've converged to an answer
-    n = 0  # loop counter
+    psu_solv, res = optimize.brentq(res_psu, psu_min, psu_max, xtol=psu_diff, maxiter=10, full_output=True, disp=False)
+    if not res.converged:
+        raise ValueError("Suction Pressure for Overall System did not converge")
 
-    while abs(psu_list[-2] - psu_list[-1]) > psu_diff:
-        psu_nxt = jf.psu_secant(psu_list[0], psu_list[1], res_list[0], res_list[1])
-        res_nxt, qoil_std, fwat_bwpd, qnz_bwpd, mach_te = discharge_residual(
-            psu_nxt, pwh, tsu, rho_pf, ppf_surf, jpump, wellbore, wellprof, ipr_su, prop_su
-        )
-        psu_list.append(psu_nxt)
-        res_list.append(res_nxt)
-        n += 1
-        if n == 10:
-            raise ValueError("Suction Pressure for Overall System did not converge")
-    return psu_list[-1], False, qoil_std, fwat_bwpd, qnz_bwpd, mach_te
+    res_psu(psu_solv)  # brent's method returns a psu it has evaluated, this is only a lookup
+    res_solv, qoil_std, fwat_bwpd, qnz_bwpd, mach_te = res_dict[psu_solv]
+    return psu_solv, False, qoil_std, fwat_bwpd, qnz_bwpd, mach_te
 
 
 def discharge_residual(
@@ -213,6 +239,8 @@ def discharge_residual(
     wellprof: WellProfile,
     ipr_su: InFlow,
     prop_su: ResMix,
+    prop_tab: ResMixTable | None = None,
+    pni: float | None = None,
 ) -> tuple[float, float, float, float, float]:
     """Discharge Residual
 
@@ -230,6 +258,8 @@ def discharge_residual(
         wellprof (WellProfile): Well Profile Class
         ipr_su (InFlow): Inflow Performance Class
         prop_su (ResMix): Reservoir Mixture Conditions
+        prop_tab (ResMixTable): Table of Reservoir Mixture Properties, optional
+        pni (float): Pressure Nozzle Inlet, psig, calculated from the power fluid if not provided
 
     Returns:
         res_di (float): Jet Pump Discharge minus Out Flow Discharge, psid
@@ -239,7 +269,8 @@ def discharge_residual(
         mach_te (float): Throat Entry Mach, unitless
     """
     # also pump out the mach value at the throat entry?
-    pni = ppf_surf + sp.diff_press_static(rho_pf, wellprof.jetpump_vd)  # static
+    if pni is None:
+        pni = ppf_surf + sp.diff_press_static(rho_pf, wellprof.jetpump_vd)  # static
 
     # jet pump section
     pte, ptm, pdi_jp, qoil_std, fwat_bwpd, qnz_bwpd, mach_te, prop_tm = jf.jetpump_overall(
@@ -256,6 +287,7 @@ def discharge_residual(
         wellbore.inn_area,
         ipr_su,
         prop_su,
+        prop_tab,
     )
 
     # out flow section
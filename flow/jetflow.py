@@ -4,15 +4,23 @@ Functions that are used for solving the fluid dynamics inside a jet pump. The ac
 jet pump geometry is accomplished in a seperate module.
 """
 
+import copy
 import math
 
 import numpy as np
-from scipy.integrate import trapezoid
+from scipy import optimize
 
 from flow import jetplot as jp
 from flow import singlephase as sp
 from flow.inflow import InFlow
-from pvt.resmix import ResMix
+from pvt.resmix import ResMix, ResMixTable
+
+# gravitational constant with in2/ft2, converts psi/(lbm/ft3) into ft2/s2
+_G144 = 144 * 32.174
+_G288 = 2 * _G144
+
+# psu_minimize results, keyed on the values that define the jet pump, ipr and fluid
+_psu_min_memo: dict[tuple, tuple[float, float, jp.JetBook]] = {}
 
 
 def enterance_ke(ken: float, vte: float) -> float:
@@ -28,7 +36,7 @@ def enterance_ke(ken: float, vte: float) -> float:
     Returns:
         ke_te: Throat Enterance Kinetic Energy, ft2/s2
     """
-    ke_te = (1 + ken) * (vte**2) / 2
+    ke_te = 0.5 * (1 + ken) * vte * vte
     return ke_te
 
 
@@ -36,9 +44,9 @@ def incremental_ee(prs_ray: np.ndarray, rho_ray: np.ndarray) -> float:
     """Fluid Incremental Expansion Energy
 
     Calculate the incremental change in expansion energy for a fluid over a
-    pressure change. Uses the trapezoid rule to sum the area under the density
-    curve for a difference in pressure. Equal to Sum (dp/ρ). The length of the
-    arrays must match and be equal or greater than length 2.
+    pressure change. Uses the trapezoid rule to find the area under the density
+    curve for a difference in pressure. Equal to dp/ρ. The arrays are the start
+    and end points of the pressure change and must be length 2.
 
     Args:
         prs_ray (np.ndarray): Array of pressures, psig
@@ -47,10 +55,31 @@ def incremental_ee(prs_ray: np.ndarray, rho_ray: np.ndarray) -> float:
     Returns:
         ee_inc (float): Expansion Energy Incremental, ft2/s2
     """
-    ee_inc = trapezoid(1 / rho_ray, 144 * 32.174 * prs_ray)
+    ee_inc = 0.5 * (1 / rho_ray[0] + 1 / rho_ray[1]) * (prs_ray[1] - prs_ray[0]) * _G144
     return ee_inc
 
 
+def cumulative_ee(prs_ray: np.ndarray, rho_ray: np.ndarray) -> np.ndarray:
+    """Fluid Cumulative Expansion Energy
+
+    Calculate the running total of the expansion energy for a fluid over a series of
+    pressure changes. Vectorized form of the incremental expansion energy, the trapezoid
+    rule is applied to every pair of neighboring points at once. The length of the arrays
+    must match and be equal or greater than length 2.
+
+    Args:
+        prs_ray (np.ndarray): Array of pressures, psig
+        rho_ray (np.ndarray): Array of densitys, lbm/ft3
+
+    Returns:
+        ee_cum (np.ndarray): Expansion Energy Cumulative, ft2/s2, one shorter than prs_ray
+    """
+    vol_ray = 1 / rho_ray  # specific volume
+    ee_inc = 0.5 * (vol_ray[:-1] + vol_ray[1:]) * (prs_ray[1:] - prs_ray[:-1]) * _G144
+    ee_cum = np.cumsum(ee_inc)
+    return ee_cum
+
+
 # change this to a function that just creates the book?
 # this only goes past crossing the zero tde line
 def throat_entry_zero_tde(
@@ -58,8 +87,9 @@ def throat_entry_zero_tde(
 ) -> tuple[float, jp.JetBook]:
     """Throat Entry Differential Energy at Zero
 
-    Create a throat entry book where the differential energy crosses zero.
-    Throat entry book can
+    Create a throat entry book where the differential energy crosses zero. Each pressure
+    step is a full pvt evaluation, so the march stops as soon as the tde crosses zero or
+    starts rising again past its minimum, a crossing can't be found after that.
     Use IPR to find the expected well production rate at the specific psu.
 
     Args:
@@ -76,28 +106,35 @@ def throat_entry_zero_tde(
     """
     qoil_std = ipr_su.oil_flow(psu, method="pidx")  # oil standard flow, bopd
 
+    pdec = 25  # pressure decrease
+    pmin = 50  # minimum pressure
+
     prop_su = prop_su.condition(psu, tsu)
-    qtot = sum(prop_su.insitu_volm_flow(qoil_std))
+    qtot = prop_su.insitu_volm_total(qoil_std)
     vte = sp.velocity(qtot, ate)
 
     te_book = jp.JetBook(psu, vte, prop_su.rho_mix(), prop_su.cmix(), enterance_ke(ken, vte))
 
-    pdec = 25  # pressure decrease
-    pmin = 50
-
-    while (te_book.tde_ray[-1] > 0) and (te_book.prs_ray[-1] > pmin):
-        pte = te_book.prs_ray[-1] - pdec
+    tde_old = te_book.tde_ray[-1]
+    pte = psu
+    while pte > pmin:
+        pte = pte - pdec
 
         prop_su = prop_su.condition(pte, tsu)
-        qtot = sum(prop_su.insitu_volm_flow(qoil_std))
+        qtot = prop_su.insitu_volm_total(qoil_std)
         vte = sp.velocity(qtot, ate)
 
         te_book.append(pte, vte, prop_su.rho_mix(), prop_su.cmix(), enterance_ke(ken, vte))
 
-        # re-evaluate criteria for this...
-        # ensures crossing zero tde while below mach limit
-        # if (te_book.mach_ray[-1] > 1) and (te_book.tde_ray[-2] > 100):
-        # raise ValueError(f"Suction Pressure of {psu} psig is too low. Select higher Psu.")
+        tde_new = te_book.tde_ray[-1]
+        if tde_new <= 0 or tde_new > tde_old:  # crossed zero, or past the minimum
+            break
+        tde_old = tde_new
+
+    # re-evaluate criteria for this...
+    # ensures crossing zero tde while below mach limit
+    # if (te_book.mach_ray[-1] > 1) and (te_book.tde_ray[-2] > 100):
+    # raise ValueError(f"Suction Pressure of {psu} psig is too low. Select higher Psu.")
 
     # pte, vte, rho_te, mach_te = te_book.dete_zero()
     return qoil_std, te_book
@@ -105,7 +142,7 @@ def throat_entry_zero_tde(
 
 # this goes until the mach number equals one
 def throat_entry_mach_one(
-    psu: float, tsu: float, ken: float, ate: float, ipr_su: InFlow, prop_su: ResMix
+    psu: float, tsu: float, ken: float, ate: float, ipr_su: InFlow, prop_su: ResMix | ResMixTable
 ) -> tuple[float, float, jp.JetBook]:
     """Throat Entry Differential Energy at Mach One
 
@@ -115,13 +152,16 @@ def throat_entry_mach_one(
     detailed derivation that shows the difference relationship to dEte and Ma value can
     be produced by Kaelin Ellis upon request
 
+    The book stops at the first point over mach one, so it still holds the zero tde
+    crossing for any psu at or above the minimum and is used directly by dete_zero.
+
     Args:
         psu (float): Suction Pressure, psig
         tsu (float): Suction Temp, deg F
         ken (float): Enterance Friction Factor, unitless
         ate (float): Throat Entry Area, ft2
         ipr_su (InFlow): IPR of Reservoir
-        prop_su (ResMix): Properties of Suction Fluid
+        prop_su (ResMix): Properties of Suction Fluid, or a table of them
 
     Returns:
         tde_fin (float): Total Differential Energy at Mach 1, ft2/s2
@@ -130,24 +170,21 @@ def throat_entry_mach_one(
     """
     qoil_std = ipr_su.oil_flow(psu, method="pidx")  # oil standard flow, bopd
 
-    prop_su = prop_su.condition(psu, tsu)
-    qtot = sum(prop_su.insitu_volm_flow(qoil_std))
-    vte = sp.velocity(qtot, ate)
-
-    te_book = jp.JetBook(psu, vte, prop_su.rho_mix(), prop_su.cmix(), enterance_ke(ken, vte))
-
     pdec = 25  # pressure decrease
     pmin = 50  # minimum pressure
 
-    # keep mach under one, and pte above pmin, so it doesn't go negative
-    while (te_book.mach_ray[-1] <= 1) and (te_book.prs_ray[-1] > pmin):
-        pte = te_book.prs_ray[-1] - pdec
+    # march down every pressure at once, ends at the first pressure at or below pmin
+    pte_ray = np.arange(psu, pmin - pdec, -pdec)
+    rho_ray, snd_ray, qtot_ray = prop_su.condition_batch(pte_ray, tsu, qoil_std)
+    vte_ray = sp.velocity(qtot_ray, ate)  # type: ignore
+    kde_ray = enterance_ke(ken, vte_ray)  # type: ignore
 
-        prop_su = prop_su.condition(pte, tsu)
-        qtot = sum(prop_su.insitu_volm_flow(qoil_std))
-        vte = sp.velocity(qtot, ate)
+    # keep mach under one, everything until the first point over mach one is kept
+    mach_ray = vte_ray / snd_ray
+    end = np.argmax(mach_ray > 1) + 1 if (mach_ray > 1).any() else len(pte_ray)
 
-        te_book.append(pte, vte, prop_su.rho_mix(), prop_su.cmix(), enterance_ke(ken, vte))
+    te_book = jp.JetBook(pte_ray[0], vte_ray[0], rho_ray[0], snd_ray[0], kde_ray[0], end)
+    te_book.extend(pte_ray[1:end], vte_ray[1:end], rho_ray[1:end], snd_ray[1:end], kde_ray[1:end])
 
     if te_book.mach_ray[-1] >= 1:  # return nearest value instead of interpolating
         tde_fin = te_book.tde_ray[-2]
@@ -158,13 +195,16 @@ def throat_entry_mach_one(
 
 
 def psu_minimize(
-    tsu: float, ken: float, ate: float, ipr_su: InFlow, prop_su: ResMix
+    tsu: float, ken: float, ate: float, ipr_su: InFlow, prop_su: ResMix, prop_tab: ResMixTable | None = None
 ) -> tuple[float, float, jp.JetBook]:
     """Minimize psu
 
     Find the smallest psu possible where the throat is choked. (Ma = 1)
     This psu is the theoretically smallest psu possible for a set jetpump and ipr combo.
     Even with an infinite amount of power fluid, you could not get below this psu.
+    The suction fluid properties are tabulated once and reused for every march.
+    Results are remembered, so repeat calls for the same well and pump are free.
+    Every call gets its own copy of the book, so appending to it can't change the memo.
 
     Args:
         tsu (float): Suction Temp, deg F
@@ -172,51 +212,81 @@ def psu_minimize(
         ate (float): Throat Entry Area, ft2
         ipr_su (InFlow): IPR of Reservoir
         prop_su (ResMix): Properties of Suction Fluid
+        prop_tab (ResMixTable): Table of Suction Fluid Properties, built if not provided
 
     Returns:
         psu_min (float): Suction Pressure Minimized, psig
         qoil_std (float): Oil Rate, STBOPD
-        pte (float): Throat Entry Pressure, psig
-        rho_te (float): Throat Entry Density, lbm/ft3
-        vte (float): Throat Entry Velocity, ft/s
+        te_book (JetBook): Book of values for inside the throat entry at psu_min
     """
-    psu_list = [ipr_su.pres - 300, ipr_su.pres - 400]
-    # store values of tee near mach=1 pressure
-    tee_list = [
-        throat_entry_mach_one(psu_list[0], tsu, ken, ate, ipr_su, prop_su)[0],
-        throat_entry_mach_one(psu_list[1], tsu, ken, ate, ipr_su, prop_su)[0],
-    ]
+    key = psu_minimize_key(tsu, ken, ate, ipr_su, prop_su)
+    if key in _psu_min_memo:
+        psu_min, qoil_std, te_book = _psu_min_memo[key]
+        return psu_min, qoil_std, copy.deepcopy(te_book)
+
+    if prop_tab is None:
+        prop_tab = suction_table(tsu, ipr_su, prop_su)
+
+    def tee_psu(psu: float) -> float:
+        return throat_entry_mach_one(psu, tsu, ken, ate, ipr_su, prop_tab)[0]
 
     psu_diff = 5  # criteria for when you've converged to an answer
-    n = 0  # loop counter
-    while abs(psu_list[-2] - psu_list[-1]) > psu_diff:
-        psu_nxt = psu_secant(psu_list[-2], psu_list[-1], tee_list[-2], tee_list[-1])
-        tee_nxt, qoil_std, te_book = throat_entry_mach_one(psu_nxt, tsu, ken, ate, ipr_su, prop_su)
-        psu_list.append(psu_nxt)
-        tee_list.append(tee_nxt)
-        n = n + 1
-        if n == 10:
-            raise ValueError("Suction Pressure for Minimization did not converge")
+    # newton without a derivative uses the secant method
+    psu_min, res = optimize.newton(
+        tee_psu, x0=ipr_su.pres - 300, x1=ipr_su.pres - 400, tol=psu_diff, maxiter=10, full_output=True, disp=False
+    )
+    if not res.converged:
+        raise ValueError("Suction Pressure for Minimization did not converge")
+
+    tee_fin, qoil_std, te_book = throat_entry_mach_one(psu_min, tsu, ken, ate, ipr_su, prop_tab)
     # pte, vte, rho_te, mach_te = te_book.dete_zero()
-    return psu_list[-1], qoil_std, te_book
 
+    if len(_psu_min_memo) >= 128:  # keep the memory bounded when sweeping lots of wells
+        _psu_min_memo.clear()
+    _psu_min_memo[key] = psu_min, qoil_std, copy.deepcopy(te_book)
+    return psu_min, qoil_std, te_book
+
+
+def psu_minimize_key(tsu: float, ken: float, ate: float, ipr_su: InFlow, prop_su: ResMix) -> tuple:
+    """Minimize psu Key
+
+    Collect the values that psu_minimize depends on into a hashable tuple. The objects
+    themselves can't be used, since they are re-conditioned and their state changes.
+
+    Args:
+        tsu (float): Suction Temp, deg F
+        ken (float): Throat Entry Friction, unitless
+        ate (float): Throat Entry Area, ft2
+        ipr_su (InFlow): IPR of Reservoir
+        prop_su (ResMix): Properties of Suction Fluid
+
+    Returns:
+        key (tuple): Defining values of the jet pump, ipr and suction fluid
+    """
+    ipr_key = (ipr_su.qwf, ipr_su.pwf, ipr_su.pres)
+    oil, wat, gas = prop_su.oil, prop_su.wat, prop_su.gas
+    prop_key = (prop_su.wc, prop_su.fgor, oil.oil_api, oil.pbp, oil.gas_sg, wat.wat_sg, gas.gas_sg)
+    return (tsu, ken, ate) + ipr_key + prop_key
 
-def psu_secant(psu1: float, psu2: float, dete1: float, dete2: float) -> float:
-    """Next Suction Pressure with Secant Method
 
-    Uses the secant method to calculate the next psu to use to find a zero dEte at Ma = 1.
+def suction_table(tsu: float, ipr_su: InFlow, prop_su: ResMix) -> ResMixTable:
+    """Suction Fluid Table
+
+    Tabulate the suction fluid properties over every pressure the throat entry can see,
+    the marches never drop below 25 psig and suction can't be above reservoir pressure.
+    The throat entry marches are then able to interpolate the properties instead of
+    evaluating the PVT at every pressure step.
 
     Args:
-        psu1 (float): Suction Pressure One, psig
-        psu2 (float): Suction Pressure Two, psig
-        dete1 (float): Differential Energy at psu1 and Ma = 1, ft2/s2
-        dete2 (float): Differential Energy at psu1 and Ma = 1, ft2/s2
+        tsu (float): Suction Temp, deg F
+        ipr_su (InFlow): IPR of Reservoir
+        prop_su (ResMix): Properties of Suction Fluid
 
-    Return:
-        psu3 (float): Suction Pressure Three, psig
+    Returns:
+        prop_tab (ResMixTable): Table of Suction Fluid Properties
     """
-    psu3 = psu2 - dete2 * (psu1 - psu2) / (dete1 - dete2)
-    return psu3
+    prop_tab = prop_su.tabulate(tsu, 25, ipr_su.pres)
+    return prop_tab
 
 
 def nozzle_velocity(pni: float, pte: float, knz: float, rho_nz: float) -> float:
@@ -233,10 +303,33 @@ def nozzle_velocity(pni: float, pte: float, knz: float, rho_nz: float) -> float:
     Returns:
         vnz (float): Nozzle Velocity, ft/s
     """
-    vnz = math.sqrt(2 * 32.174 * 144 * (pni - pte) / (rho_nz * (1 + knz)))
+    vnz = math.sqrt(_G288 * (pni - pte) / (rho_nz * (1 + knz)))
     return vnz
 
 
+def nozzle_velocity_ray(pni: float | np.ndarray, pte: float | np.ndarray, knz: float, rho_nz: float) -> np.ndarray:
+    """Nozzle Velocity Array
+
+    Solve Bernoulli's Equation to calculate the nozzle velocity in ft/s over arrays of
+    nozzle inlet or throat entry pressures, such as a sweep of power fluid pressures.
+    Use nozzle_rate on the result, it works on arrays as well.
+
+    Args:
+        pni (float or np array): Nozzle Inlet Pressure, psig
+        pte (float or np array): Throat Entry Pressure, psig
+        knz (float): Friction of Nozzle, unitless
+        rho_nz (float): Density of Nozzle Fluid, lbm/ft3
+
+    Returns:
+        vnz_ray (np array): Nozzle Velocity, ft/s
+    """
+    dp_nz = np.subtract(pni, pte)
+    if (dp_nz < 0).any():
+        raise ValueError("Throat Entry Pressure is greater than the Nozzle Inlet Pressure")
+    vnz_ray = np.sqrt(_G288 * dp_nz / (rho_nz * (1 + knz)))
+    return vnz_ray
+
+
 def nozzle_rate(vnz: float, anz: float) -> tuple[float, float]:
     """Nozzle Flow Rate
 
@@ -317,8 +410,9 @@ def throat_discharge(
 
     Solves the throat mixture equation of the jet pump. Calculates throat differntial pressure.
     Use the throat entry pressure and differential pressure to calculate throat mix pressure.
-    Account for the discharge pressure is greater than the inlet pressure. Loops through the
-    calculated discharge pressure until a converged answer occurs.
+    Account for the discharge pressure is greater than the inlet pressure. The differential
+    pressure only depends on ptm through the mixture density, so the discharge pressure is
+    substituted back in as a fixed point until it moves less than 5 psi.
 
     Args:
         pte (float): Pressure of Throat Entry, psig
@@ -342,33 +436,27 @@ def throat_discharge(
     ath = anz + ate  # area of the throat
     mtm = mnz + mte  # mass flow of total mixture
 
-    rho_tm = prop_tm.condition(pte, tte).rho_mix()  # density of total mixture
-    vtm = sp.velocity(mtm / rho_tm, ath)
-
-    mom_tm, mom_fr = throat_outlet_momentum(kth, vtm, ath, rho_tm)
-    mom_tot = mom_fr + mom_tm - mom_nz - mom_te
-    dp_tm = sp.mom_to_psi(mom_tot, ath)  # lbf/in2
-
-    ptm = pte - dp_tm
-    ptm_list = [pte, ptm]
-
-    ptm_diff = 5
-    n = 0
-    while abs(ptm_list[-2] - ptm_list[-1]) > ptm_diff:
-        ptm = ptm_list[-1]
-
+    def ptm_update(ptm: float) -> float:
         rho_tm = prop_tm.condition(ptm, tte).rho_mix()  # density of total mixture
         vtm = sp.velocity(mtm / rho_tm, ath)
 
         mom_tm, mom_fr = throat_outlet_momentum(kth, vtm, ath, rho_tm)
         mom_tot = mom_fr + mom_tm - mom_nz - mom_te
         dp_tm = sp.mom_to_psi(mom_tot, ath)  # lbf/in2
-        ptm = pte - dp_tm
-        ptm_list.append(ptm)
+        return pte - dp_tm
+
+    ptm_old = pte
+    ptm_new = ptm_update(ptm_old)
+
+    ptm_diff = 5
+    n = 0
+    while abs(ptm_old - ptm_new) > ptm_diff:
+        ptm_old = ptm_new
+        ptm_new = ptm_update(ptm_old)
         n += 1
         if n == 10:
             raise ValueError("Throat Mixture did not converge")
-    return ptm_list[-1]
+    return ptm_new
 
 
 def throat_wc(qoil_std: float, wc_su: float, qwat_nz: float) -> tuple[float, float]:
@@ -406,7 +494,7 @@ def diffuser_ke(kdi: float, vtm: float, vdi: float) -> float:
     Returns:
         ke_di: Diffuser Kinetic Energy, ft2/s2
     """
-    ke_di = (vdi**2 - (1 - kdi) * vtm**2) / 2
+    ke_di = 0.5 * (vdi * vdi - (1 - kdi) * vtm * vtm)
     return ke_di
 
 
@@ -432,11 +520,11 @@ def diffuser_discharge(
         pdi (float): Diffuser Discharge Pressure, psig
     """
     prop_tm = prop_tm.condition(ptm, ttm)
-    qtot = sum(prop_tm.insitu_volm_flow(qoil_std))
+    qtot = prop_tm.insitu_volm_total(qoil_std)
     vdi = sp.velocity(qtot, adi)
     vtm = sp.velocity(qtot, ath)
 
-    di_book = jp.JetBook(ptm, vdi, prop_tm.rho_mix(), prop_tm.cmix(), diffuser_ke(kdi, vtm, vdi))
+    di_book = jp.JetBook(ptm, vdi, prop_tm.rho_mix(), prop_tm.cmix(), diffuser_ke(kdi, vtm, vdi), size=16)
 
     pinc = 100  # pressure increase
 
@@ -444,7 +532,7 @@ def diffuser_discharge(
         pdi = di_book.prs_ray[-1] + pinc
 
         prop_tm = prop_tm.condition(pdi, ttm)
-        qtot = sum(prop_tm.insitu_volm_flow(qoil_std))
+        qtot = prop_tm.insitu_volm_total(qoil_std)
         vdi = sp.velocity(qtot, adi)
 
         di_book.append(pdi, vdi, prop_tm.rho_mix(), prop_tm.cmix(), diffuser_ke(kdi, vtm, vdi))
@@ -467,6 +555,7 @@ def jetpump_overall(
     adi: float,
     ipr_su: InFlow,
     prop_su: ResMix,
+    prop_tab: ResMixTable | None = None,
 ) -> tuple[float, float, float, float, float, float, float, ResMix]:
     """Jet Pump Overall Equations
 
@@ -487,6 +576,7 @@ def jetpump_overall(
         adi (float): Diffuser Area, ft2
         ipr_su (InFlow): IPR of Reservoir
         prop_su (ResMix): Properties of Suction Fluid
+        prop_tab (ResMixTable): Table of Suction Fluid Properties, optional
 
     Returns:
         pte (float): Throat Entry Pressure, psig
@@ -499,7 +589,10 @@ def jetpump_overall(
         prop_tm (ResMix): Properties of Discharge Fluid
     """
     ate = ath - anz
-    qoil_std, te_book = throat_entry_zero_tde(psu=psu, tsu=tsu, ken=ken, ate=ate, ipr_su=ipr_su, prop_su=prop_su)
+    if prop_tab is None:  # pvt is evaluated every step, stop the march early
+        qoil_std, te_book = throat_entry_zero_tde(psu, tsu, ken, ate, ipr_su, prop_su)
+    else:  # the table is cheap, interpolate the whole march at once
+        tde_fin, qoil_std, te_book = throat_entry_mach_one(psu, tsu, ken, ate, ipr_su, prop_tab)
     pte, vte, rho_te, mach_te = te_book.dete_zero()
 
     vnz = nozzle_velocity(pni, pte, knz, rho_ni)
@@ -507,7 +600,84 @@ def jetpump_overall(
     qnz_ft3s, qnz_bwpd = nozzle_rate(vnz, anz)
     wc_tm, fwat_bwpd = throat_wc(qoil_std, prop_su.wc, qnz_bwpd)
 
-    prop_tm = ResMix(wc_tm, prop_su.fgor, prop_su.oil, prop_su.wat, prop_su.gas)
+    prop_tm = prop_su.with_wc(wc_tm)
     ptm = throat_discharge(pte, tsu, kth, vnz, anz, rho_ni, vte, ate, rho_te, prop_tm)
     vtm, pdi = diffuser_discharge(ptm, tsu, kdi, ath, adi, qoil_std, prop_tm)
     return pte, ptm, pdi, qoil_std, fwat_bwpd, qnz_bwpd, mach_te, prop_tm
+
+
+def jetpump_overall_ray(
+    psu_ray: np.ndarray,
+    tsu: float,
+    pni: float,
+    rho_ni: float,
+    ken: float,
+    knz: float,
+    kth: float,
+    kdi: float,
+    ath: float,
+    anz: float,
+    adi: float,
+    ipr_su: InFlow,
+    prop_su: ResMix,
+    prop_tab: ResMixTable | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Jet Pump Overall Equations over an Array of Suction Pressures
+
+    Solve the jetpump equations at every suction pressure in an array. The throat entry is
+    marched the same way as jetpump_overall, so the results match it when both are given the
+    same table, or both are not. The nozzle and throat watercut are evaluated on the whole
+    array at once. The throat mixture watercut is different at each
+    suction pressure, so the throat and diffuser are still solved one pressure at a time.
+
+    Args:
+        psu_ray (np array): Suction Pressures, psig
+        tsu (float): Suction Temp, deg F
+        pni (float): Nozzle Inlet Pressure, psig
+        rho_ni (float): Nozzle Inlet Density, lbm/ft3
+        ken (float): Enterance Friction Factor, unitless
+        knz (float): Nozzle Friction Factor, unitless
+        kth (float): Throat Friction Factor, unitless
+        kdi (float): Diffuser Friction Factor, unitless
+        ath (float): Throat Area, ft2
+        anz (float): Nozzle Area, ft2
+        adi (float): Diffuser Area, ft2
+        ipr_su (InFlow): IPR of Reservoir
+        prop_su (ResMix): Properties of Suction Fluid
+        prop_tab (ResMixTable): Table of Suction Fluid Properties, optional
+
+    Returns:
+        pte_ray (np array): Throat Entry Pressure, psig
+        ptm_ray (np array): Throat Mixture Pressure, psig
+        pdi_ray (np array): Diffuser Discharge Pressure, psig
+        qoil_ray (np array): Oil Rate, STBOPD
+        fwat_ray (np array): Formation Water Rate, BWPD
+        qnz_ray (np array): Power Fluid Rate, BWPD
+        mach_ray (np array): Throat Entry Mach, unitless
+    """
+    ate = ath - anz
+    pte_ray = np.empty(len(psu_ray))
+    vte_ray = np.empty(len(psu_ray))
+    rho_ray = np.empty(len(psu_ray))
+    mach_ray = np.empty(len(psu_ray))
+    qoil_ray = np.empty(len(psu_ray))
+    for i, psu in enumerate(psu_ray):
+        if prop_tab is None:
+            qoil_ray[i], te_book = throat_entry_zero_tde(psu, tsu, ken, ate, ipr_su, prop_su)
+        else:
+            tde_fin, qoil_ray[i], te_book = throat_entry_mach_one(psu, tsu, ken, ate, ipr_su, prop_tab)
+        pte_ray[i], vte_ray[i], rho_ray[i], mach_ray[i] = te_book.dete_zero()
+
+    vnz_ray = nozzle_velocity_ray(pni, pte_ray, knz, rho_ni)
+    qnz_ft3s, qnz_ray = nozzle_rate(vnz_ray, anz)  # type: ignore
+    wc_ray, fwat_ray = throat_wc(qoil_ray, prop_su.wc, qnz_ray)  # type: ignore
+
+    ptm_ray = np.empty(len(psu_ray))
+    pdi_ray = np.empty(len(psu_ray))
+    for i in range(len(psu_ray)):
+        prop_tm = prop_su.with_wc(wc_ray[i])
+        ptm_ray[i] = throat_discharge(
+            pte_ray[i], tsu, kth, vnz_ray[i], anz, rho_ni, vte_ray[i], ate, rho_ray[i], prop_tm
+        )
+        vtm, pdi_ray[i] = diffuser_discharge(ptm_ray[i], tsu, kdi, ath, adi, qoil_ray[i], prop_tm)
+    return pte_ray, ptm_ray, pdi_ray, qoil_ray, fwat_ray, qnz_ray, mach_ray
@@ -17,22 +17,28 @@ Returns:
         grad_ray (np array): Gradient of tde/dp Array, ft2/(s2*psig)
 """
 
+from typing import TYPE_CHECKING
+
 import numpy as np
-from matplotlib import pyplot as plt
-from matplotlib.axes._axes import Axes
 
 from flow import jetflow as jf  # legacy
 from flow import singlephase as sp
 from flow.inflow import InFlow
 from pvt.resmix import ResMix
 
+# pyplot is slow to import, it is only loaded inside of the functions that plot
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
 
 class JetBook:
-    def __init__(self, prs: float, vel: float, rho: float, snd: float, kde: float):
+    def __init__(self, prs: float, vel: float, rho: float, snd: float, kde: float, size: int = 50):
         """Book for storing Jet Pump Enterance / Diffuser Calculations
 
         Create a book for storing results values from the throat enterance and diffuser.
-        Can be used later for graphing and other analysis.
+        Can be used later for graphing and other analysis. Arrays are preallocated to
+        the size specified and doubled if more values are appended than expected.
 
         Args:
             prs (float): Pressure, psig
@@ -40,21 +46,76 @@ class JetBook:
             rho (float): Density, lbm/ft3
             snd (float): Speed of Sound, ft/s
             kde (float): Kinetic Differential Energy, ft2/s2
+            size (int): Number of values to preallocate in the arrays
         """
-        self.prs_ray = np.array([prs])
-        self.vel_ray = np.array([vel])
-        self.rho_ray = np.array([rho])
-        self.snd_ray = np.array([snd])
-
-        self.kde_ray = np.array([kde])
-
-        ede = 0
+        self._len = 1  # number of values stored in the book
+        self._prs = np.empty(size, dtype=np.float64)
+        self._vel = np.empty(size, dtype=np.float64)
+        self._rho = np.empty(size, dtype=np.float64)
+        self._snd = np.empty(size, dtype=np.float64)
+        self._kde = np.empty(size, dtype=np.float64)
+        self._ede = np.empty(size, dtype=np.float64)  # expansion energy array
+        self._tde = np.empty(size, dtype=np.float64)  # total differential energy
+        self._mach = np.empty(size, dtype=np.float64)  # mach number
+        self._grad = np.empty(size, dtype=np.float64)  # gradient of tde vs prs
+
+        ede = 0.0
         tde = kde + ede
 
-        self.ede_ray = np.array([ede])  # expansion energy array
-        self.tde_ray = np.array([tde])  # total differential energy
-        self.mach_ray = np.array([vel / snd])  # mach number
-        self.grad_ray = np.array([np.nan])  # gradient of tde vs prs
+        self._prs[0] = prs
+        self._vel[0] = vel
+        self._rho[0] = rho
+        self._snd[0] = snd
+        self._kde[0] = kde
+        self._ede[0] = ede
+        self._tde[0] = tde
+        self._mach[0] = vel / snd
+        self._grad[0] = np.nan
+
+    @property
+    def prs_ray(self) -> np.ndarray:
+        """Pressure Array, psig"""
+        return self._prs[: self._len]
+
+    @property
+    def vel_ray(self) -> np.ndarray:
+        """Velocity Array, ft/s"""
+        return self._vel[: self._len]
+
+    @property
+    def rho_ray(self) -> np.ndarray:
+        """Density Array, lbm/ft3"""
+        return self._rho[: self._len]
+
+    @property
+    def snd_ray(self) -> np.ndarray:
+        """Speed of Sound Array, ft/s"""
+        return self._snd[: self._len]
+
+    @property
+    def kde_ray(self) -> np.ndarray:
+        """Kinetic Differential Energy Array, ft2/s2"""
+        return self._kde[: self._len]
+
+    @property
+    def ede_ray(self) -> np.ndarray:
+        """Expansion Differential Energy Array, ft2/s2"""
+        return self._ede[: self._len]
+
+    @property
+    def tde_ray(self) -> np.ndarray:
+        """Total Differential Energy Array, ft2/s2"""
+        return self._tde[: self._len]
+
+    @property
+    def mach_ray(self) -> np.ndarray:
+        """Mach Number Array, unitless"""
+        return self._mach[: self._len]
+
+    @property
+    def grad_ray(self) -> np.ndarray:
+        """Gradient of tde/dp Array, ft2/(s2*psig)"""
+        return self._grad[: self._len]
 
     # https://docs.python.org/3/library/string.html#formatspec
     def __repr__(self):
@@ -80,29 +141,79 @@ class JetBook:
             snd (float): Speed of Sound, ft/s
             kde (float): Kinetic Differential Energy, ft2/s2
         """
-        self.prs_ray = np.append(self.prs_ray, prs)
-        self.vel_ray = np.append(self.vel_ray, vel)
-        self.rho_ray = np.append(self.rho_ray, rho)
-        self.snd_ray = np.append(self.snd_ray, snd)
-        self.kde_ray = np.append(self.kde_ray, kde)
+        i = self._len
+        if i == len(self._prs):
+            self._grow()
+
+        self._prs[i] = prs
+        self._vel[i] = vel
+        self._rho[i] = rho
+        self._snd[i] = snd
+        self._kde[i] = kde
 
-        ede = self.ede_ray[-1] + jf.incremental_ee(self.prs_ray[-2:], self.rho_ray[-2:])
+        ede = self._ede[i - 1] + jf.incremental_ee(self._prs[i - 1 : i + 1], self._rho[i - 1 : i + 1])  # noqa E203
         tde = kde + ede
 
-        self.ede_ray = np.append(self.ede_ray, ede)
-        self.tde_ray = np.append(self.tde_ray, tde)
-        self.mach_ray = np.append(self.mach_ray, vel / snd)  # mach number
+        self._ede[i] = ede
+        self._tde[i] = tde
+        self._mach[i] = vel / snd  # mach number
+        self._grad[i] = (self._tde[i - 1] - tde) / (self._prs[i - 1] - prs)  # gradient of tde vs prs
+        self._len = i + 1
 
-        grad = (self.tde_ray[-2] - self.tde_ray[-1]) / (self.prs_ray[-2] - self.prs_ray[-1])
-        self.grad_ray = np.append(self.grad_ray, grad)  # gradient of tde vs prs
+    def extend(
+        self, prs_ray: np.ndarray, vel_ray: np.ndarray, rho_ray: np.ndarray, snd_ray: np.ndarray, kde_ray: np.ndarray
+    ) -> None:
+        """Extend Arrays onto the Throat Entry Book
 
-    def plot_te(self) -> None:
+        Vectorized version of append. The energy, mach and gradient arrays are
+        calculated for all the values at once instead of one value at a time.
+
+        Args:
+            prs_ray (np array): Pressure Array, psig
+            vel_ray (np array): Velocity Array, ft/s
+            rho_ray (np array): Density Array, lbm/ft3
+            snd_ray (np array): Speed of Sound Array, ft/s
+            kde_ray (np array): Kinetic Differential Energy Array, ft2/s2
+        """
+        i = self._len
+        j = i + len(prs_ray)
+        while j > len(self._prs):
+            self._grow()
+
+        self._prs[i:j] = prs_ray
+        self._vel[i:j] = vel_ray
+        self._rho[i:j] = rho_ray
+        self._snd[i:j] = snd_ray
+        self._kde[i:j] = kde_ray
+
+        # include the last stored value, the energy is relative to it
+        self._ede[i:j] = self._ede[i - 1] + jf.cumulative_ee(self._prs[i - 1 : j], self._rho[i - 1 : j])  # noqa E203
+        self._tde[i:j] = self._kde[i:j] + self._ede[i:j]
+        self._mach[i:j] = self._vel[i:j] / self._snd[i:j]
+        self._grad[i:j] = np.diff(self._tde[i - 1 : j]) / np.diff(self._prs[i - 1 : j])  # noqa E203
+        self._len = j
+
+    def _grow(self) -> None:
+        """Double the Preallocated Size of the Book Arrays"""
+        size = len(self._prs)
+        for name in ("_prs", "_vel", "_rho", "_snd", "_kde", "_ede", "_tde", "_mach", "_grad"):
+            ray = np.empty(2 * size, dtype=np.float64)
+            ray[:size] = getattr(self, name)
+            setattr(self, name, ray)
+
+    def plot_te(self, show: bool = True) -> "Figure":
         """Throat Entry Plots
 
         Create a series of graphs to use for visualization of the results
         in the book from the throat entry area.
+
+        Args:
+            show (bool): Display the figure, set False for batch runs and close it when done
+
+        Returns:
+            fig (Figure): Matplotlib Figure of the throat entry graphs
         """
-        self._throat_entry_graphs(
+        fig = self._throat_entry_graphs(
             self.prs_ray,
             self.vel_ray,
             self.rho_ray,
@@ -112,15 +223,25 @@ class JetBook:
             self.tde_ray,
             self.grad_ray,
         )
-        return None
+        if show:
+            import matplotlib.pyplot as plt
+
+            plt.show()
+        return fig
 
-    def plot_di(self) -> None:
+    def plot_di(self, show: bool = True) -> "Figure":
         """Diffuser Plots
 
         Create a series of graphs to use for visualization of the results in
         the book from the diffuser area.
+
+        Args:
+            show (bool): Display the figure, set False for batch runs and close it when done
+
+        Returns:
+            fig (Figure): Matplotlib Figure of the diffuser graphs
         """
-        self._diffuser_graphs(
+        fig = self._diffuser_graphs(
             self.prs_ray,
             self.vel_ray,
             self.rho_ray,
@@ -129,7 +250,11 @@ class JetBook:
             self.ede_ray,
             self.tde_ray,
         )
-        return None
+        if show:
+            import matplotlib.pyplot as plt
+
+            plt.show()
+        return fig
 
     def dete_zero(self) -> tuple[float, float, float, float]:
         """Throat Entry Parameters at Zero Total Differential Energy
@@ -180,15 +305,21 @@ class JetBook:
             rho_te (float): Throat Entry Density, lbm/ft3
             mach_te (float): Mach Throat Entry, unitless
         """
-        dtdp = np.gradient(tde_ray, prs_ray)  # uses central limit thm, so same size
-        mask = dtdp >= 0  # only points where slope is greater than or equal to zero
-
-        tde_flipped = np.flip(tde_ray[mask])
-
-        pte = np.interp(0, tde_flipped, np.flip(prs_ray[mask]))
-        vte = np.interp(0, tde_flipped, np.flip(vel_ray[mask]))
-        rho_te = np.interp(0, tde_flipped, np.flip(rho_ray[mask]))
-        mach_te = np.interp(0, tde_flipped, np.flip(mach_ray[mask]))
+        # tde falls as the pressure drops until it hits a minimum, only the falling side is valid
+        rise_idx = np.flatnonzero(np.diff(tde_ray) > 0)
+        low = rise_idx[0] if rise_idx.size else len(tde_ray) - 1
+        # falling side is sorted, binary search it for the first tde at or below zero
+        cross = np.searchsorted(-tde_ray[: low + 1], 0)
+
+        if cross > low or cross == 0:  # zero is never crossed, return nearest value at the minimum
+            i = min(low, cross)
+            return prs_ray[i], vel_ray[i], rho_ray[i], mach_ray[i]
+
+        frac = tde_ray[cross - 1] / (tde_ray[cross - 1] - tde_ray[cross])  # linear interpolation
+        pte = prs_ray[cross - 1] + frac * (prs_ray[cross] - prs_ray[cross - 1])
+        vte = vel_ray[cross - 1] + frac * (vel_ray[cross] - vel_ray[cross - 1])
+        rho_te = rho_ray[cross - 1] + frac * (rho_ray[cross] - rho_ray[cross - 1])
+        mach_te = mach_ray[cross - 1] + frac * (mach_ray[cross] - mach_ray[cross - 1])
 
         return pte, vte, rho_te, mach_te  # type: ignore
 
@@ -202,16 +333,16 @@ class JetBook:
         ede_ray: np.ndarray,
         tde_ray: np.ndarray,
         grad_ray: np.ndarray,
-    ) -> None:
+    ) -> "Figure":
+        import matplotlib.pyplot as plt
 
         mach_ray = vel_ray / snd_ray
-        # grad_ray = np.gradient(tde_ray, prs_ray)
         psu = prs_ray[0]
         pmo = float(np.interp(1, mach_ray, prs_ray))  # interpolate for pressure at mach 1, pmo
         pgo = float(np.interp(0, np.flip(grad_ray), np.flip(prs_ray)))  # find point where gradient is zero
         pte, vte, rho_te, mach_te = JetBook._dete_zero(prs_ray, vel_ray, rho_ray, tde_ray, mach_ray)
 
-        fig, axs = plt.subplots(4, sharex=True)
+        fig, axs = plt.subplots(4, sharex=True, constrained_layout=True)
         plt.rcParams["mathtext.default"] = "regular"
         fig.suptitle(f"Suction at {round(psu,0)} psi, Mach 1 at {round(pmo,0)} psi")
 
@@ -240,9 +371,7 @@ class JetBook:
         axs[3].annotate(text="Grad 0", xy=(pgo, 2 * ycoord / 8), rotation=90)
         axs[3].set_ylabel("$dE_{te}$, ft2/s2")
         axs[3].set_xlabel("Throat Entry Pressure, psig")
-
-        plt.show()
-        return None
+        return fig
 
     @staticmethod
     def _diffuser_graphs(
@@ -253,11 +382,12 @@ class JetBook:
         kde_ray: np.ndarray,
         ede_ray: np.ndarray,
         tde_ray: np.ndarray,
-    ) -> None:
+    ) -> "Figure":
+        import matplotlib.pyplot as plt
 
         ptm = prs_ray[0]
 
-        fig, axs = plt.subplots(4, sharex=True)
+        fig, axs = plt.subplots(4, sharex=True, constrained_layout=True)
         plt.rcParams["mathtext.default"] = "regular"
 
         axs[0].scatter(prs_ray, 1 / rho_ray)
@@ -293,7 +423,7 @@ class JetBook:
             fig.suptitle(f"Diffuser Inlet and Outlet at {round(ptm,0)} and {round(pdi,0)} psi")  # type: ignore
         else:
             fig.suptitle(f"Diffuser Inlet at {round(ptm,0)} psi")
-        plt.show()
+        return fig
 
 
 # this goes all the way down to 200 psig
@@ -320,24 +450,14 @@ def throat_entry_book(
     """
     qoil_std = ipr_su.oil_flow(psu, method="pidx")  # oil standard flow, bopd
 
-    prop_su = prop_su.condition(psu, tsu)
-    qtot = sum(prop_su.insitu_volm_flow(qoil_std))
-    vte = sp.velocity(qtot, ate)
-
-    te_book = JetBook(psu, vte, prop_su.rho_mix(), prop_su.cmix(), jf.enterance_ke(ken, vte))
-
     ray_len = 50  # number of elements in the array
-    pte_ray = np.linspace(200, psu, ray_len)  # throat entry pressures
-    pte_ray = np.flip(pte_ray, axis=0)  # start with high pressure and go low
-
-    for pte in pte_ray[1:]:  # start with the second value, psu is the first and is used to create array
-
-        prop_su = prop_su.condition(pte, tsu)
-        qtot = sum(prop_su.insitu_volm_flow(qoil_std))
-        vte = sp.velocity(qtot, ate)
-
-        te_book.append(pte, vte, prop_su.rho_mix(), prop_su.cmix(), jf.enterance_ke(ken, vte))
+    pte_ray = np.linspace(psu, 200, ray_len)  # throat entry pressures, start with high pressure and go low
+    rho_ray, snd_ray, qtot_ray = prop_su.condition_batch(pte_ray, tsu, qoil_std)
+    vte_ray = sp.velocity(qtot_ray, ate)
+    kde_ray = jf.enterance_ke(ken, vte_ray)  # type: ignore
 
+    te_book = JetBook(pte_ray[0], vte_ray[0], rho_ray[0], snd_ray[0], kde_ray[0], ray_len)  # type: ignore
+    te_book.extend(pte_ray[1:], vte_ray[1:], rho_ray[1:], snd_ray[1:], kde_ray[1:])  # type: ignore
     return qoil_std, te_book
 
 
@@ -362,30 +482,21 @@ def diffuser_book(
         vtm (float): Throat Mixture Velocity, ft/s
         di_book (JetBook): Book of values of what is occuring inside throat entry
     """
-    prop_tm = prop_tm.condition(ptm, ttm)
-    qtot = sum(prop_tm.insitu_volm_flow(qoil_std))
-    vtm = sp.velocity(qtot, ath)
-    vdi = sp.velocity(qtot, adi)
-
-    di_book = JetBook(ptm, vdi, prop_tm.rho_mix(), prop_tm.cmix(), jf.diffuser_ke(kdi, vtm, vdi))
-
     ray_len = 30
-    pdi_ray = np.linspace(ptm, ptm + 1500, ray_len)  # throat entry pressures
-
-    for pdi in pdi_ray[1:]:  # start with 2nd value, ptm already used previously
-
-        prop_tm = prop_tm.condition(pdi, ttm)
-        qtot = sum(prop_tm.insitu_volm_flow(qoil_std))
-        vdi = sp.velocity(qtot, adi)
-
-        di_book.append(pdi, vdi, prop_tm.rho_mix(), prop_tm.cmix(), jf.diffuser_ke(kdi, vtm, vdi))
-
+    pdi_ray = np.linspace(ptm, ptm + 1500, ray_len)  # diffuser pressures
+    rho_ray, snd_ray, qtot_ray = prop_tm.condition_batch(pdi_ray, ttm, qoil_std)
+    vtm = sp.velocity(qtot_ray[0], ath)
+    vdi_ray = sp.velocity(qtot_ray, adi)
+    kde_ray = jf.diffuser_ke(kdi, vtm, vdi_ray)  # type: ignore
+
+    di_book = JetBook(pdi_ray[0], vdi_ray[0], rho_ray[0], snd_ray[0], kde_ray[0], ray_len)  # type: ignore
+    di_book.extend(pdi_ray[1:], vdi_ray[1:], rho_ray[1:], snd_ray[1:], kde_ray[1:])  # type: ignore
     return vtm, di_book
 
 
 def multi_throat_entry_books(
     psu_ray: list | np.ndarray, tsu: float, ken: float, ate: float, ipr_su: InFlow, prop_su: ResMix
-) -> tuple[list, list]:
+) -> tuple[np.ndarray, list]:
     """Multiple Throat Entry Arrays
 
     Calculate throat entry arrays at different suction pressures. Used to
@@ -400,7 +511,7 @@ def multi_throat_entry_books(
         prop_su (ResMix): Properties of Suction Fluid
 
     Returns:
-        qoil_list (list): List of Oil Rates
+        qoil_ray (np array): Array of Oil Rates, BOPD
         book_list (list): List of Jet Book Results
     """
     if max(psu_ray) >= ipr_su.pres:
@@ -410,28 +521,29 @@ def multi_throat_entry_books(
         raise ValueError("Min suction pressure must be greater than 200 psig")
 
     book_list = list()  # create empty list to fill up with results
-    qoil_list = list()
-
-    for psu in psu_ray:
-        qoil_std, te_book = throat_entry_book(psu, tsu, ken, ate, ipr_su, prop_su)
+    qoil_ray = np.empty(len(psu_ray))
 
-        qoil_list.append(qoil_std)
+    for i, psu in enumerate(psu_ray):
+        qoil_ray[i], te_book = throat_entry_book(psu, tsu, ken, ate, ipr_su, prop_su)
         book_list.append(te_book)
 
-    return qoil_list, book_list
+    return qoil_ray, book_list
 
 
-def te_tde_subsonic_plot(qoil_std: float, te_book: JetBook, color: str) -> Axes:
+def te_tde_subsonic_plot(qoil_std: float, te_book: JetBook, color: str, ax: "Axes | None" = None) -> "Axes":
     """Throat Entry (TE) Total Differential Energy (TDE) for Subsonic Values Plot
 
     Args:
         qoil_std (float): Oil Rate, BOPD
         te_book (JetBook): Throat Entry Results Book
         color (string): Matplotlib Recognized Color Description
+        ax (Axis): Matplotlib Axis to plot on, defaults to the current axis
 
     Return:
         ax (Axis): Matplotlib Axis to be used later
     """
+    import matplotlib.pyplot as plt
+
     psu = te_book.prs_ray[0]
     pmo = np.interp(1, te_book.mach_ray, te_book.prs_ray)
     tde_pmo = np.interp(pmo, np.flip(te_book.prs_ray), np.flip(te_book.tde_ray))
@@ -439,31 +551,35 @@ def te_tde_subsonic_plot(qoil_std: float, te_book: JetBook, color: str) -> Axes:
     pte_ray = te_book.prs_ray[te_book.prs_ray >= pmo]
     tee_ray = te_book.tde_ray[te_book.prs_ray >= pmo]
 
-    ax = plt.gca()
+    if ax is None:
+        ax = plt.gca()
     ax.scatter(pte_ray, tee_ray, color=color, label=f"{int(qoil_std)} bopd, {int(psu)} psi")
     ax.scatter(pmo, tde_pmo, marker="v", color=color)  # type: ignore
     return ax
 
 
-def multi_suction_graphs(qoil_list: list, book_list: list) -> None:
+def multi_suction_graphs(qoil_list: list | np.ndarray, book_list: list, show: bool = True) -> "Figure":
     """Throat Entry Graphs for Multiple Suction Pressures
 
     Create a graph that shows throat entry equation solutions for multiple suction pressures
 
     Args:
-        qoil_list (list): List of Oil Rates at different suction pressures
+        qoil_list (list): List or Array of Oil Rates at different suction pressures
         book_list (list): List of throat entry books at various suction pressures
+        show (bool): Display the figure, set False for batch runs and close it when done
 
     Returns:
-        Graphs
+        fig (Figure): Matplotlib Figure of the throat entry graphs
     """
+    import matplotlib.pyplot as plt
+
     plt.rcParams["mathtext.default"] = "regular"
     prop_cycle = plt.rcParams["axes.prop_cycle"]()  # convert to iterator
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig, ax = plt.subplots(figsize=(8, 6), constrained_layout=True)
 
     for qoil_std, te_book in zip(qoil_list, book_list):
         color = next(prop_cycle)["color"]  # new color method
-        te_tde_subsonic_plot(qoil_std, te_book, color)  # need parent and children classes
+        te_tde_subsonic_plot(qoil_std, te_book, color, ax)  # need parent and children classes
 
     ax.set_xlabel("Throat Entry Pressure, psig")
     ax.set_ylabel("$dE_{te}$, ft2/s2")
@@ -471,4 +587,6 @@ def multi_suction_graphs(qoil_list: list, book_list: list) -> None:
     ax.set_title("Figure 5 of SPE-202928-MS, Mach 1 at \u25BC")
     ax.legend()
 
-    plt.show()
+    if show:
+        plt.show()
+    return fig
@@ -1,4 +1,5 @@
-import matplotlib.pyplot as plt
+from functools import cached_property
+
 import numpy as np
 from scipy import optimize
 
@@ -18,23 +19,27 @@ class WellProfile:
         """Create a Well Profile
 
         Args:
-            md_list (list): List of measured depths
-            vd_list (list): List of vertical depths
+            md_list (list): List or Array of measured depths
+            vd_list (list): List or Array of vertical depths
             jetpump_md (float): Measured depth of Jet Pump, feet
 
         Returns:
             Self
         """
-        if len(md_list) != len(vd_list):
+        # copy into float arrays in one block of memory, the fits and caches are built from them
+        md_ray = np.array(md_list, dtype=np.float64, order="C")
+        vd_ray = np.array(vd_list, dtype=np.float64, order="C")
+
+        if len(md_ray) != len(vd_ray):
             raise ValueError("Lists for Measured Depth and Vertical Depth need to be the same length")
 
-        if max(md_list) < max(vd_list):
+        if md_ray.max() < vd_ray.max():
             raise ValueError("Measured Depth needs to extend farther than Vertical Depth")
 
-        self.md_ray = np.array(md_list)
-        self.vd_ray = np.array(vd_list)
+        self.md_ray = md_ray
+        self.vd_ray = vd_ray
         self.hd_ray = self._horz_dist(self.md_ray, self.vd_ray)
-        self.jetpump_md = jetpump_md
+        self.jetpump_md = jetpump_md  # setter also creates the outflow spacing storage
 
         # here is the real question, do I even need the raw data? just filter the data
         # at the __init__ and be done? Is the raw data just more stuff to wade through?
@@ -69,6 +74,18 @@ class WellProfile:
         return self._depth_interp(vd_dpth, self.vd_ray, self.md_ray)
 
     @property
+    def jetpump_md(self) -> float:
+        """Jet Pump Measured Depth, Feet"""
+        return self._jetpump_md
+
+    @jetpump_md.setter
+    def jetpump_md(self, jetpump_md: float) -> None:
+        self._jetpump_md = jetpump_md
+        # vertical depth and outflow spacing are calculated from the jet pump depth, clear them out
+        self.__dict__.pop("jetpump_vd", None)
+        self._spacing = {}  # outflow spacing for each segment length
+
+    @cached_property
     def jetpump_vd(self) -> float:
         """Jet Pump True Vertical Depth, Feet"""
         jp_vd = self.vd_interp(self.jetpump_md)
@@ -111,7 +128,9 @@ class WellProfile:
 
         Break the outflow piping into nodes that can be fed  with piping dimension
         flowrates and etc to calculate differential pressure across them. Outflow is
-        assumed to start at the jetpump.
+        assumed to start at the jetpump. Spacing is stored for each segment length,
+        so repeated outflow calculations do not rebuild it. Setting a new jetpump_md
+        clears the stored spacing. The stored arrays are shared, so they are read only.
 
         Args:
             seg_len (float): Segment Length of Outflow Piping, feet
@@ -120,7 +139,12 @@ class WellProfile:
             md_seg (np array): Measured depth Broken into segments
             vd_seg (np array): Vertical depth broken into segments
         """
-        return self._outflow_spacing(self.md_fit, self.vd_fit, self.jetpump_md, seg_len)
+        if seg_len not in self._spacing:
+            md_seg, vd_seg = self._outflow_spacing(self.md_fit, self.vd_fit, self.jetpump_md, seg_len)
+            md_seg.setflags(write=False)  # every outflow march gets these arrays, don't let one edit them
+            vd_seg.setflags(write=False)
+            self._spacing[seg_len] = md_seg, vd_seg
+        return self._spacing[seg_len]
 
     @staticmethod
     def _outflow_spacing(
@@ -207,6 +231,8 @@ class WellProfile:
             td_ray (np array): Vertical depth, feet
             md_ray (np arary): Measured depth, feet
         """
+        import matplotlib.pyplot as plt  # slow to import, only loaded when plotting
+
         if len(md_ray) > 20:
             plt.scatter(hd_ray, vd_ray)
         else:
@@ -1,3 +1,5 @@
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 from assembly.run_pump import model_pump
 
@@ -6,6 +8,7 @@ This is a file to call the run_pump file from Assembly folder
 
 Loops through a list of jet pump nozzle and throat sizes and returns a csv file with the results
 Update well characterisitics in the call to the model pump function
+Each nozzle and throat size is independent, so they are spread across processes
 
 """
 
@@ -13,29 +16,40 @@ Update well characterisitics in the call to the model pump function
 nozzles = ["9", "10", "11", "12", "13", "14"]
 throats = ["X", "A", "B", "C", "D", "E"]
 
-results = []
 
-for nozzle in nozzles:
-    for throat in throats:
+def model_size(nozzle: str, throat: str) -> tuple:
+    return model_pump(
+        True,  # isSchrader?
+        pwh=201,  # WHP
+        rho_pf=62.4,  # PF density
+        ppf_surf=2419,  # PF pres
+        out_dia=4.5,  # Tubing OD
+        thick=0.5,  # tubing thickness
+        qwf=320,  # Oil rate
+        pwf=547,  # FBHP
+        res_pres=800,  # res pressure
+        form_wc=0.01,  # watercut
+        form_gor=507,  # gor
+        form_temp=72,  # form temp
+        nozzle_no=nozzle,  # nozzle size
+        throat=throat,  # nozzel area ratio with throat
+        wellname="MPB-35",
+    )
+
+
+# the guard is required, the worker processes import this file when they start on windows
+if __name__ == "__main__":
+    results = []
+
+    with ProcessPoolExecutor() as pool:
+        futures = {
+            (nozzle, throat): pool.submit(model_size, nozzle, throat) for nozzle in nozzles for throat in throats
+        }
+
+    for (nozzle, throat), future in futures.items():
         try:
             psu_solv, sonic_status, qoil_std, fwat_bwpd, qnz_bwpd, mach_te, total_wc, total_water, wellname = (
-                model_pump(
-                    True,  # isSchrader?
-                    pwh=201,  # WHP
-                    rho_pf=62.4,  # PF density
-                    ppf_surf=2419,  # PF pres
-                    out_dia=4.5,  # Tubing OD
-                    thick=0.5,  # tubing thickness
-                    qwf=320,  # Oil rate
-                    pwf=547,  # FBHP
-                    res_pres=800,  # res pressure
-                    form_wc=0.01,  # watercut
-                    form_gor=507,  # gor
-                    form_temp=72,  # form temp
-                    nozzle_no=nozzle,  # nozzle size
-                    throat=throat,  # nozzel area ratio with throat
-                    wellname="MPB-35",
-                )
+                future.result()
             )
             result = {
                 "nozzle": nozzle,
@@ -54,7 +68,7 @@ for nozzle in nozzles:
         except Exception as e:
             print(f"An error occurred for nozzle {nozzle} and throat {throat}: {e}")
 
-df_results = pd.DataFrame(results)
-df_sorted = df_results.sort_values(by="psu_solv", ascending=True)
-df_sorted.to_csv("modelrun_output B-35.csv")
-print(df_sorted)
+    df_results = pd.DataFrame(results)
+    df_sorted = df_results.sort_values(by="psu_solv", ascending=True)
+    df_sorted.to_csv("modelrun_output B-35.csv")
+    print(df_sorted)
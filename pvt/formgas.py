@@ -257,23 +257,23 @@ class FormGas:
         Return:
             zfactor (float): Gas Compressibility, unitless
         """
-        z_ray = [0.95, 0.91]  # start calculation with a guess
+        zold, znew = 0.95, 0.91  # start calculation with a guess
         a1, a2, a3, a4, a5, a6, a7, a8, a9, a10, a11 = FormGas._dak_constants()
         c1 = FormGas._dak_c1(tpr, a1, a2, a3, a4, a5)
         c2 = FormGas._dak_c2(tpr, a6, a7, a8)
         c3 = FormGas._dak_c3(tpr, a7, a8, a9)
 
         # need to loop this section for z-factor convergence
-        while abs(z_ray[-2] - z_ray[-1]) > 0.001:
-            rho_pr = FormGas._dak_rho_pr(z_ray[-1], ppr, tpr)
+        while abs(zold - znew) > 0.001:
+            zold = znew
+            rho_pr = FormGas._dak_rho_pr(zold, ppr, tpr)
             c4 = FormGas._dak_c4(rho_pr, tpr, a10, a11)
-            zfun = FormGas._dak_zfun(z_ray[-1], rho_pr, c1, c2, c3, c4)
-            c5 = FormGas._dak_c5(z_ray[-1], rho_pr, tpr, a10, a11)
-            zder = FormGas._dak_zderv(z_ray[-1], rho_pr, c1, c2, c3, c5)
-            znew = z_ray[-1] - zfun / zder  # newtons method
-            z_ray.append(znew)
+            zfun = FormGas._dak_zfun(zold, rho_pr, c1, c2, c3, c4)
+            c5 = FormGas._dak_c5(zold, rho_pr, tpr, a10, a11)
+            zder = FormGas._dak_zderv(zold, rho_pr, c1, c2, c3, c5)
+            znew = zold - zfun / zder  # newtons method
 
-        return z_ray[-1]
+        return znew
 
     @staticmethod
     def _dak_constants() -> tuple[float, float, float, float, float, float, float, float, float, float, float]:
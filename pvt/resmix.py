@@ -1,5 +1,8 @@
+import copy
 import math
 
+import numpy as np
+
 from pvt.blackoil import BlackOil
 from pvt.formgas import FormGas
 from pvt.formwat import FormWater
@@ -40,6 +43,40 @@ class ResMix:
         # return(f'Mixture with {self.oil.oil_api} API Oil')
         return f"Mixture at {100*self.wc}% Watercut and {self.fgor} SCF/STB FGOR"
 
+    def with_wc(self, wc: float):
+        """Mixture with a New Watercut
+
+        Create a copy of the mixture at a different watercut, such as after power fluid
+        is added. The oil, water and gas and their standard densities are reused
+        instead of being conditioned again.
+
+        Args:
+            wc (float): Watercut of the New Mixture, 0 to 1
+
+        Returns:
+            prop_wc (ResMix): Mixture at the New Watercut
+        """
+        prop_wc = copy.copy(self)
+        prop_wc.wc = wc
+        return prop_wc
+
+    def tabulate(self, temp: float, p_lo: float, p_hi: float, n: int = 101):
+        """Tabulate the Mixture
+
+        Evaluate the mixture once on a log pressure grid at a single temperature.
+        The table is interpolated afterwards, see ResMixTable.
+
+        Args:
+            temp (float): Temperature of the mixture, deg F
+            p_lo (float): Lowest Pressure in the Table, psig
+            p_hi (float): Highest Pressure in the Table, psig
+            n (int): Number of Pressures in the Table
+
+        Returns:
+            prop_tab (ResMixTable): Table of the Mixture Properties
+        """
+        return ResMixTable(self, temp, p_lo, p_hi, n)
+
     def condition(self, press: float, temp: float):
         """Set condition of evaluation
 
@@ -64,6 +101,36 @@ class ResMix:
         self._tempr = self.temp + 459.67  # convert fahr to rankine
         return self
 
+    def condition_batch(
+        self, press_ray: np.ndarray, temp: float, qoil_std: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Evaluate a Batch of Conditions
+
+        Condition the mixture at every pressure in an array and return the properties
+        needed for a pressure march. The mixture is left at the last pressure.
+
+        Args:
+            press_ray (np array): Pressures of the mixture, psig
+            temp (float): Temperature of the mixture, deg F
+            qoil_std (float): Oil Rate, BOPD
+
+        Returns:
+            rho_ray (np array): Density of Mixture, lbm/ft3
+            snd_ray (np array): Speed of Sound in the Mixture, ft/s
+            qtot_ray (np array): Insitu Volumetric Flow of the Mixture, ft3/s
+        """
+        rho_ray = np.empty(len(press_ray))
+        snd_ray = np.empty(len(press_ray))
+        qtot_ray = np.empty(len(press_ray))
+
+        for i, press in enumerate(press_ray):
+            self.condition(press, temp)
+            # cmix shifts the gas condition, so it is evaluated last
+            qtot_ray[i] = self.insitu_volm_total(qoil_std)
+            rho_ray[i] = self.rho_mix()
+            snd_ray[i] = self.cmix()
+        return rho_ray, snd_ray, qtot_ray
+
     def rho_comp(self) -> tuple[float, float, float]:
         """Density Components
 
@@ -304,6 +371,61 @@ class ResMix:
         qoil, qwat, qgas = self._static_insitu_volm_flow(qoil_std, self.rho_oil_std, self.oil.density, yoil, ywat, ygas)
         return qoil, qwat, qgas
 
+    def insitu_volm_total(self, qoil_std: float) -> float:
+        """Insitu Volumetric Flow of the Mixture
+
+        Calculate the total insitu volumetric flow rate of the mixture in ft3/s.
+        Same as the sum of insitu_volm_flow, without building each component.
+
+        Args:
+            qoil_std (float): Oil Rate, BOPD
+
+        Returns:
+            qtot (float): Mixture Volumetric Flow, Insitu ft3/s
+        """
+        xoil, xwat, xgas = self.mass_fract()
+        rho_oil, rho_wat, rho_gas = self.rho_comp()
+        rho_mix = self._homogenous_density(xoil, xwat, xgas, rho_oil, rho_wat, rho_gas)
+        yoil = xoil * rho_mix / rho_oil  # only the oil fraction is needed
+
+        qoil = self._static_insitu_oil_flow(qoil_std, self.rho_oil_std, rho_oil)
+        qtot = qoil / yoil  # oil flow divided by oil total fraction
+        return qtot
+
+    @staticmethod
+    def _static_oil_mass_flow(qoil_std: float, rho_oil_std: float) -> float:
+        """Oil Mass Flow
+
+        Convert the standard oil rate into a mass flow in lbm/s
+
+        Args:
+            qoil_std (float): Oil Rate, BOPD
+            rho_oil_std (float): Density Oil at Std Cond, lbm/ft3
+
+        Returns:
+            moil (float): Oil Mass Flow, lbm/s
+        """
+        # 42 gal/bbl, 7.48052 gal/ft3, 24 hr/day, 60min/hour, 60sec/min
+        qoil_cfs = qoil_std * 42 / (24 * 60 * 60 * 7.48052)  # ft3/s at standard conditions
+        moil = qoil_cfs * rho_oil_std  # mass flow of oil
+        return moil
+
+    @staticmethod
+    def _static_insitu_oil_flow(qoil_std: float, rho_oil_std: float, rho_oil: float) -> float:
+        """Insitu Volumetric Flow of Oil
+
+        Args:
+            qoil_std (float): Oil Rate, BOPD
+            rho_oil_std (float): Density Oil at Std Cond, lbm/ft3
+            rho_oil (float): Density Oil Insitu Cond, lbm/ft3
+
+        Returns:
+            qoil (float): Oil Volumetric Flow, Insitu ft3/s
+        """
+        moil = ResMix._static_oil_mass_flow(qoil_std, rho_oil_std)
+        qoil = moil / rho_oil  # actual flow, ft3/s
+        return qoil
+
     @staticmethod
     def _static_insitu_volm_flow(
         qoil_std: float, rho_oil_std: float, rho_oil: float, yoil: float, ywat: float, ygas: float
@@ -325,10 +447,7 @@ class ResMix:
             qwat (float): Water Volumetric Flow, Insitu ft3/s
             qgas (float): Gas Volumetric Flow, Insitu ft3/s
         """
-        # 42 gal/bbl, 7.48052 gal/ft3, 24 hr/day, 60min/hour, 60sec/min
-        qoil_cfs = qoil_std * 42 / (24 * 60 * 60 * 7.48052)  # ft3/s at standard conditions
-        moil = qoil_cfs * rho_oil_std  # mass flow of oil
-        qoil = moil / rho_oil  # actual flow, ft3/s
+        qoil = ResMix._static_insitu_oil_flow(qoil_std, rho_oil_std, rho_oil)
 
         qtot = qoil / yoil  # oil flow divided by oil total fraction
         qwat = ywat * qtot
@@ -376,9 +495,7 @@ class ResMix:
             mwat (float): Water Mass Flow, lbm/s
             mgas (float): Gas Mass Flow, lbm/s
         """
-        # 42 gal/bbl, 7.48052 gal/ft3, 24 hr/day, 60min/hour, 60sec/min
-        qoil_cfs = qoil_std * 42 / (24 * 60 * 60 * 7.48052)  # ft3/s at standard conditions
-        moil = qoil_cfs * rho_oil_std  # mass flow of oil
+        moil = ResMix._static_oil_mass_flow(qoil_std, rho_oil_std)
         mtot = moil / xoil
         mwat = xwat * mtot
         mgas = xgas * mtot
@@ -521,3 +638,84 @@ class ResMix:
         """
         nslh = (yoil + ywat) / (yoil + ywat + ygas)
         return nslh
+
+
+class ResMixTable:
+    def __init__(self, prop: ResMix, temp: float, p_lo: float, p_hi: float, n: int = 101) -> None:
+        """Reservoir Mixture Table
+
+        Tabulate the properties of a reservoir mixture at a single temperature over a range
+        of pressures. The mixture is evaluated once at each point of the table, afterwards
+        the properties are linearly interpolated on log10 of the absolute pressure for a
+        whole batch of pressures in a march at once.
+
+        Args:
+            prop (ResMix): Reservoir Mixture to Tabulate
+            temp (float): Temperature of the mixture, deg F
+            p_lo (float): Lowest Pressure in the Table, psig
+            p_hi (float): Highest Pressure in the Table, psig
+            n (int): Number of Pressures in the Table
+
+        Returns:
+            Self
+        """
+        self.temp = temp
+        self.p_lo = p_lo
+        self.p_hi = p_hi
+
+        # pressures are evenly spaced in log10 psia, so the index can be calculated directly
+        self._log_lo = math.log10(p_lo + 14.7)
+        self._log_inc = (math.log10(p_hi + 14.7) - self._log_lo) / (n - 1)
+        prs_ray = np.geomspace(p_lo + 14.7, p_hi + 14.7, n) - 14.7  # psig
+
+        rho_ray = np.empty(n)
+        snd_ray = np.empty(n)
+        qoil_ray = np.empty(n)  # insitu flows for one bopd, ft3/s
+        qwat_ray = np.empty(n)
+        qgas_ray = np.empty(n)
+
+        for i, press in enumerate(prs_ray):
+            prop = prop.condition(press, temp)
+            # cmix shifts the gas condition, so it is evaluated last
+            qoil_ray[i], qwat_ray[i], qgas_ray[i] = prop.insitu_volm_flow(1)
+            rho_ray[i] = prop.rho_mix()
+            snd_ray[i] = prop.cmix()
+
+        self._rho_ray = rho_ray
+        self._snd_ray = snd_ray
+        self._qtot_ray = qoil_ray + qwat_ray + qgas_ray
+
+    def __repr__(self) -> str:
+        return f"Mixture Table from {self.p_lo} to {self.p_hi} psig at {self.temp} deg F"
+
+    def condition_batch(
+        self, press_ray: np.ndarray, temp: float, qoil_std: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Evaluate a Batch of Conditions
+
+        Interpolate the properties needed for a pressure march at every pressure
+        in an array at once.
+
+        Args:
+            press_ray (np array): Pressures of the mixture, psig
+            temp (float): Temperature of the mixture, deg F, must match the table
+            qoil_std (float): Oil Rate, BOPD
+
+        Returns:
+            rho_ray (np array): Density of Mixture, lbm/ft3
+            snd_ray (np array): Speed of Sound in the Mixture, ft/s
+            qtot_ray (np array): Insitu Volumetric Flow of the Mixture, ft3/s
+        """
+        if temp != self.temp:
+            raise ValueError(f"Table is built at {self.temp} deg F, not {temp} deg F")
+        if press_ray.size == 0 or press_ray.min() < self.p_lo or press_ray.max() > self.p_hi:
+            raise ValueError("Pressures are not inside table boundary")
+
+        pos = (np.log10(press_ray + 14.7) - self._log_lo) / self._log_inc
+        idx = np.minimum(pos.astype(int), len(self._rho_ray) - 2)  # keep p_hi inside the last interval
+        wgt = pos - idx
+
+        rho_ray = self._rho_ray[idx] + wgt * (self._rho_ray[idx + 1] - self._rho_ray[idx])
+        snd_ray = self._snd_ray[idx] + wgt * (self._snd_ray[idx + 1] - self._snd_ray[idx])
+        qtot_ray = qoil_std * (self._qtot_ray[idx] + wgt * (self._qtot_ray[idx + 1] - self._qtot_ray[idx]))
+        return rho_ray, snd_ray, qtot_ray
@@ -1,4 +1,4 @@
-import os
+from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -7,8 +7,8 @@ import pandas as pd
 from pvt.blackoil import BlackOil
 
 # only works if the command python -m tests.boil_test is used
-dirname = os.getcwd()
-filename = os.path.join(dirname, r"data\oil_22_api_hysys_peng_rob.xlsx")  # , r"data\methane_hysys_peng_rob.xlsx")
+dirname = Path.cwd()
+filename = dirname / "data" / "oil_22_api_hysys_peng_rob.xlsx"
 
 hys_df = pd.read_excel(filename, header=1)
 
@@ -44,43 +44,34 @@ wellprof = WellProfile.schrader()
 # find the minimum psu, then find maximum, calculate pdi and compare?
 # also calculate pdi_of for each case / residual?
 
-psu_min, qoil_std, te_book = jf.psu_minimize(form_temp, e41_jp.ken, e41_jp.ate, ipr_su, prop_su)
+prop_tab = jf.suction_table(form_temp, ipr_su, prop_su)  # suction properties shared by the sweep
+psu_min, qoil_std, te_book = jf.psu_minimize(form_temp, e41_jp.ken, e41_jp.ate, ipr_su, prop_su, prop_tab)
 psu_max = ipr_su.pres - 10
 
 psu_list = np.linspace(psu_min, psu_max, 10)
 
-pte_list = []
-ptm_list = []
-pdi_list = []
-qoil_list = []
-
 pni = ppf_surf + sp.diff_press_static(rho_pf, wellprof.jetpump_vd)  # static
 
-for psu in psu_list:
-    pte, ptm, pdi, qoil_std, fwat_bwpd, qnz_bwpd, mach_te, prop_tm = jf.jetpump_overall(
-        psu,
-        form_temp,
-        pni,
-        rho_pf,
-        e41_jp.ken,
-        e41_jp.knz,
-        e41_jp.kth,
-        e41_jp.kdi,
-        e41_jp.ath,
-        e41_jp.anz,
-        tube.inn_area,
-        ipr_su,
-        prop_su,
-    )
-
-    pte_list.append(pte)
-    ptm_list.append(ptm)
-    pdi_list.append(pdi)
-    qoil_list.append(qoil_std)
-
-plt.scatter(psu_list, pdi_list, label="Discharge")
-plt.scatter(psu_list, ptm_list, label="Throat Mix")
-plt.scatter(psu_list, pte_list, label="Throat Entry")
+pte_ray, ptm_ray, pdi_ray, qoil_ray, fwat_ray, qnz_ray, mach_ray = jf.jetpump_overall_ray(
+    psu_list,
+    form_temp,
+    pni,
+    rho_pf,
+    e41_jp.ken,
+    e41_jp.knz,
+    e41_jp.kth,
+    e41_jp.kdi,
+    e41_jp.ath,
+    e41_jp.anz,
+    tube.inn_area,
+    ipr_su,
+    prop_su,
+    prop_tab,
+)
+
+plt.scatter(psu_list, pdi_ray, label="Discharge")
+plt.scatter(psu_list, ptm_ray, label="Throat Mix")
+plt.scatter(psu_list, pte_ray, label="Throat Entry")
 plt.xlabel("Suction Pressure, psig")
 plt.ylabel("Pressure, psig")
 plt.title("Comparison of Jet Pump Pressures Against Suction")
@@ -5,7 +5,7 @@ import numpy as np
 from pvt.blackoil import BlackOil
 from pvt.formgas import FormGas
 from pvt.formwat import FormWater
-from pvt.resmix import ResMix
+from pvt.resmix import ResMix, ResMixTable
 
 # print(sys.path)
 # sys.path.append("c:\\Users\\ka9612\\OneDrive - Hilcorp\\vs_code\\hilcorpak")
@@ -36,3 +36,13 @@ print(f"cmix: {e42.cmix()} ft/s")
 
 print("Oil, Water, Gas Volm Fractions")
 print(e42.volm_fract())
+
+# tabulated mixture properties should match the direct calculation
+e42_tab = ResMixTable(e42, temp, 25, 1400)
+rho_tab, snd_tab, qtot_tab = e42_tab.condition_batch(np.array([press]), temp, 1)
+
+print("Tabulated vs Direct Mixture")
+rho_direct = e42.condition(press, temp).rho_mix()
+snd_direct = e42.condition(press, temp).cmix()
+print(f"Density - Direct: {round(rho_direct, 4)}, Table: {round(rho_tab[0], 4)} lbm/ft3")
+print(f"Sound - Direct: {round(snd_direct, 2)}, Table: {round(snd_tab[0], 2)} ft/s")
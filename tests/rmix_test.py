@@ -1,4 +1,4 @@
-import os
+from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -22,8 +22,8 @@ wc = 0.3  # watercut
 fgor = 800  # scf/stb
 
 # mass fraction, volm fraction, mixture density, speed of sound (no hysys...)
-dirname = os.getcwd()
-filename = os.path.join(dirname, r"data\resmix_hysys_peng_rob.xlsx")
+dirname = Path.cwd()
+filename = dirname / "data" / "resmix_hysys_peng_rob.xlsx"
 
 hy_df = pd.read_excel(filename, header=1)
 